@@ -10,225 +10,520 @@ import os
 import sys
 import re
 from pathlib import Path
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple, Collection
 import argparse
 
 # Try to use real Jinja2 if available, otherwise use SimpleTemplate fallback
 try:
-    from jinja2 import Template as Jinja2Template
+    from jinja2 import Environment, FileSystemLoader
     USE_JINJA2 = True
 except ImportError:
     USE_JINJA2 = False
 
+# Use orjson for faster parsing if available
+try:
+    import orjson
+    USE_ORJSON = True
+except ImportError:
+    USE_ORJSON = False
+
+# Jinja2 environments keyed by templates directory, so each template is
+# parsed and compiled once and reused for every document rendered from it
+_JINJA2_ENVIRONMENTS: Dict[str, Any] = {}
+
+
+def get_jinja2_environment(templates_dir: Path) -> "Environment":
+    """Get the shared Jinja2 environment for a templates directory"""
+    key = str(templates_dir)
+    env = _JINJA2_ENVIRONMENTS.get(key)
+    if env is None:
+        env = Environment(
+            loader=FileSystemLoader(key),
+            auto_reload=False,
+            cache_size=-1,
+        )
+        _JINJA2_ENVIRONMENTS[key] = env
+    return env
 
-class SimpleTemplate:
-    """Minimal Jinja2-like template engine"""
-
-    def __init__(self, template_str: str):
-        self.template = template_str
-
-    def apply_filter(self, value: Any, filter_name: str) -> Any:
-        """Apply a filter to a value"""
-        if filter_name == 'title':
-            return str(value).replace('-', ' ').replace('_', ' ').title()
-        elif filter_name == 'length':
-            return len(value) if hasattr(value, '__len__') else 0
-        elif filter_name.startswith('join'):
-            # Extract separator from filter (e.g., "join(', ')")
-            match = re.search(r"join\(['\"]([^'\"]*)['\"]\)", filter_name)
-            if match and isinstance(value, list):
-                separator = match.group(1)
-                return separator.join(str(v) for v in value)
-            return str(value)
-        return value
-
-    def resolve_value(self, expr: str, context: Dict[str, Any]) -> Any:
-        """Resolve a variable expression with optional filters"""
-        # Split expression and filters
-        parts = expr.strip().split('|')
-        var_expr = parts[0].strip()
-        filters = [f.strip() for f in parts[1:]]
-
-        # Resolve the base variable
-        value = context
-        for key in var_expr.split('.'):
-            key = key.strip()
-            if isinstance(value, dict):
-                value = value.get(key, '')
-            elif hasattr(value, key):
-                value = getattr(value, key)
-            else:
-                value = ''
-                break
-
-        # Apply filters
-        for filter_name in filters:
-            value = self.apply_filter(value, filter_name)
-
-        return value
-
-    def render(self, context: Dict[str, Any]) -> str:
-        """Render template with context"""
-        result = self.template
-
-        # Handle nested loops with .items(): {% for key, value in dict.items() %}...{% endfor %}
-        items_pattern = r'{%\s*for\s+(\w+)\s*,\s*(\w+)\s+in\s+([\w.]+)\.items\(\)\s*%}(.*?){%\s*endfor\s*%}'
-
-        def replace_items_loop(match):
-            key_var = match.group(1)
-            value_var = match.group(2)
-            dict_name = match.group(3)
-            loop_body = match.group(4)
-
-            dict_obj = self.resolve_value(dict_name, context)
-            if not isinstance(dict_obj, dict):
-                return ""
-
-            output = []
-            for key, value in dict_obj.items():
-                loop_context = context.copy()
-                loop_context[key_var] = key
-                loop_context[value_var] = value
 
-                # Recursively render the loop body
-                template = SimpleTemplate(loop_body)
-                body_result = template.render(loop_context)
-                output.append(body_result)
+# SimpleTemplate syntax: {{ expression }}, {% statement %} and {# comment #}
+_TAG_RE = re.compile(r'({{.*?}}|{%.*?%}|{#.*?#})', re.DOTALL)
+_FOR_TAG_RE = re.compile(r'for\s+(\w+(?:\s*,\s*\w+)*)\s+in\s+(.+)$', re.DOTALL)
+_EXPR_TOKEN_RE = re.compile(
+    r"""\s*(?:(?P<number>\d+(?:\.\d+)?)"""
+    r"""|(?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")"""
+    r"""|(?P<name>[A-Za-z_]\w*)"""
+    r"""|(?P<op>==|!=|[.|()\[\],]))"""
+)
+_WORD_BEGINNING_SPLIT_RE = re.compile(r'([-\s({\[<]+)')
 
-            return "".join(output)
+_CONSTANTS = {
+    "true": "True",
+    "false": "False",
+    "none": "None",
+    "True": "True",
+    "False": "False",
+    "None": "None",
+}
 
-        result = re.sub(items_pattern, replace_items_loop, result, flags=re.DOTALL)
 
-        # Handle loops with .keys(): {% for key in dict.keys() %}...{% endfor %}
-        keys_pattern = r'{%\s*for\s+(\w+)\s+in\s+([\w.]+)\.keys\(\)\s*%}(.*?){%\s*endfor\s*%}'
+class _Undefined:
+    """Missing value that renders empty and is falsy, like Jinja2's Undefined"""
 
-        def replace_keys_loop(match):
-            var_name = match.group(1)
-            dict_name = match.group(2)
-            loop_body = match.group(3)
+    __slots__ = ()
 
-            dict_obj = self.resolve_value(dict_name, context)
-            if not isinstance(dict_obj, dict):
-                return ""
+    def __str__(self) -> str:
+        return ''
 
-            output = []
-            for key in dict_obj.keys():
-                loop_context = context.copy()
-                loop_context[var_name] = key
+    def __bool__(self) -> bool:
+        return False
 
-                # Recursively render the loop body
-                template = SimpleTemplate(loop_body)
-                body_result = template.render(loop_context)
-                output.append(body_result)
+    def __len__(self) -> int:
+        return 0
 
-            return "".join(output)
+    def __iter__(self):
+        return iter(())
 
-        result = re.sub(keys_pattern, replace_keys_loop, result, flags=re.DOTALL)
+    def __call__(self, *args: Any, **kwargs: Any) -> "_Undefined":
+        return self
 
-        # Handle regular loops: {% for item in items %}...{% endfor %}
-        for_pattern = r'{%\s*for\s+(\w+)\s+in\s+([\w.]+)\s*%}(.*?){%\s*endfor\s*%}'
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _Undefined)
 
-        def replace_for(match):
-            var_name = match.group(1)
-            list_name = match.group(2)
-            loop_body = match.group(3)
+    def __hash__(self) -> int:
+        return 0
 
-            items = self.resolve_value(list_name, context)
-            if not isinstance(items, (list, dict)):
-                return ""
 
-            # Handle both lists and dict values
-            if isinstance(items, dict):
-                items = list(items.values())
+_UNDEFINED = _Undefined()
 
-            output = []
-            for item in items:
-                loop_context = context.copy()
-                loop_context[var_name] = item
 
-                # If item is a dict, also add its keys directly to context for easier access
-                if isinstance(item, dict):
-                    for key, value in item.items():
-                        loop_context[f"{var_name}.{key}"] = value
+# Attribute names of plain dicts, the only names `dict.name` resolves as attributes
+_DICT_ATTRIBUTES = frozenset(dir(dict))
 
-                # Recursively render the loop body
-                template = SimpleTemplate(loop_body)
-                body_result = template.render(loop_context)
-                output.append(body_result)
 
-            return "".join(output)
+def _getattr(obj: Any, name: str) -> Any:
+    """Resolve `obj.name`, preferring attributes over items like Jinja2"""
+    # Fast path for the context's record dicts: skip the failed getattr()
+    if type(obj) is dict and name not in _DICT_ATTRIBUTES:
+        return obj.get(name, _UNDEFINED)
 
-        result = re.sub(for_pattern, replace_for, result, flags=re.DOTALL)
+    try:
+        return getattr(obj, name)
+    except AttributeError:
+        pass
+    try:
+        return obj[name]
+    except (TypeError, LookupError):
+        return _UNDEFINED
 
-        # Handle conditionals with comparison: {% if var1 == var2 %}...{% endif %}
-        if_compare_pattern = r'{%\s*if\s+([\w.]+)\s*==\s*([\w.]+)\s*%}(.*?){%\s*endif\s*%}'
 
-        def replace_if_compare(match):
-            left_expr = match.group(1)
-            right_expr = match.group(2)
-            body = match.group(3)
+def _getitem(obj: Any, key: Any) -> Any:
+    """Resolve `obj[key]`, preferring items over attributes like Jinja2"""
+    try:
+        return obj[key]
+    except (TypeError, LookupError):
+        pass
+    if isinstance(key, str):
+        try:
+            return getattr(obj, key)
+        except AttributeError:
+            pass
+    return _UNDEFINED
+
+
+def _filter_title(value: Any) -> str:
+    """Capitalize each word, treating '-' and brackets as word boundaries"""
+    return "".join(
+        item[0].upper() + item[1:].lower()
+        for item in _WORD_BEGINNING_SPLIT_RE.split(str(value))
+        if item
+    )
 
-            left_val = self.resolve_value(left_expr, context)
-            right_val = self.resolve_value(right_expr, context)
 
-            if left_val == right_val:
-                template = SimpleTemplate(body)
-                return template.render(context)
-            return ""
+def _filter_length(value: Any) -> int:
+    """Return the number of items in a value"""
+    return len(value) if hasattr(value, '__len__') else 0
+
+
+def _filter_join(value: Any, separator: str = '') -> str:
+    """Join the items of a value into a string"""
+    return separator.join(str(v) for v in value)
+
+
+def _filter_default(value: Any, default_value: Any = '', boolean: bool = False) -> Any:
+    """Substitute a default for undefined (or, with boolean, falsy) values"""
+    if value is _UNDEFINED or (boolean and not value):
+        return default_value
+    return value
+
+
+_FILTERS = {
+    "title": _filter_title,
+    "length": _filter_length,
+    "count": _filter_length,
+    "join": _filter_join,
+    "default": _filter_default,
+    "d": _filter_default,
+    "lower": lambda value: str(value).lower(),
+    "upper": lambda value: str(value).upper(),
+    "trim": lambda value: str(value).strip(),
+}
+
+# Globals available to compiled render functions
+_RUNTIME: Dict[str, Any] = {
+    "_UNDEFINED": _UNDEFINED,
+    "_getattr": _getattr,
+    "_getitem": _getitem,
+    "_FILTERS": _FILTERS,
+}
+
+
+class _ExpressionCompiler:
+    """Compiles a template expression into a Python expression"""
+
+    def __init__(self, expr: str, scope: Dict[str, str]):
+        self.expr = expr
+        self.scope = scope
+        self.tokens = self._tokenize(expr.rstrip())
+        self.pos = 0
+
+    def _tokenize(self, expr: str) -> List[Tuple[str, str]]:
+        tokens = []
+        pos = 0
+        while pos < len(expr):
+            match = _EXPR_TOKEN_RE.match(expr, pos)
+            if not match or not match.lastgroup:
+                raise ValueError(f"Invalid template expression: {self.expr!r}")
+            tokens.append((match.lastgroup, match.group(match.lastgroup)))
+            pos = match.end()
+        return tokens
+
+    def _peek(self) -> Tuple[Optional[str], Optional[str]]:
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return (None, None)
+
+    def _next(self) -> Tuple[str, str]:
+        if self.pos >= len(self.tokens):
+            raise ValueError(f"Unexpected end of template expression: {self.expr!r}")
+        self.pos += 1
+        return self.tokens[self.pos - 1]
+
+    def _expect(self, op: str) -> None:
+        if self._next() != ("op", op):
+            raise ValueError(f"Expected '{op}' in template expression: {self.expr!r}")
+
+    def compile(self) -> str:
+        """Return Python source for the whole expression"""
+        code = self._parse_or()
+        if self.pos != len(self.tokens):
+            raise ValueError(f"Invalid template expression: {self.expr!r}")
+        return code
+
+    def _parse_or(self) -> str:
+        code = self._parse_and()
+        while self._peek() == ("name", "or"):
+            self.pos += 1
+            code = f"({code} or {self._parse_and()})"
+        return code
+
+    def _parse_and(self) -> str:
+        code = self._parse_not()
+        while self._peek() == ("name", "and"):
+            self.pos += 1
+            code = f"({code} and {self._parse_not()})"
+        return code
+
+    def _parse_not(self) -> str:
+        if self._peek() == ("name", "not"):
+            self.pos += 1
+            return f"(not {self._parse_not()})"
+        return self._parse_compare()
+
+    def _parse_compare(self) -> str:
+        code = self._parse_filtered()
+        kind, op = self._peek()
+        if kind == "op" and op in ("==", "!="):
+            self.pos += 1
+            code = f"({code} {op} {self._parse_filtered()})"
+        return code
+
+    def _parse_filtered(self) -> str:
+        code = self._parse_primary()
+        while self._peek() == ("op", "|"):
+            self.pos += 1
+            kind, name = self._next()
+            if kind != "name" or name not in _FILTERS:
+                raise ValueError(f"Unknown filter '{name}' in template expression: {self.expr!r}")
+            args = self._parse_args() if self._peek() == ("op", "(") else []
+            code = f"_FILTERS[{name!r}]({', '.join([code] + args)})"
+        return code
+
+    def _parse_args(self) -> List[str]:
+        self._expect("(")
+        args = []
+        while self._peek() != ("op", ")"):
+            args.append(self._parse_or())
+            if self._peek() != ("op", ","):
+                break
+            self.pos += 1
+        self._expect(")")
+        return args
+
+    def _parse_primary(self) -> str:
+        kind, value = self._next()
+        if kind == "name":
+            if value in _CONSTANTS:
+                code = _CONSTANTS[value]
+            elif value in self.scope:
+                code = self.scope[value]
+            else:
+                code = f"ctx.get({value!r}, _UNDEFINED)"
+        elif kind in ("number", "string"):
+            code = value
+        elif value == "(":
+            code = self._parse_or()
+            self._expect(")")
+        else:
+            raise ValueError(f"Invalid template expression: {self.expr!r}")
+
+        while True:
+            token = self._peek()
+            if token == ("op", "."):
+                self.pos += 1
+                kind, attr = self._next()
+                if kind != "name":
+                    raise ValueError(f"Invalid attribute in template expression: {self.expr!r}")
+                code = f"_getattr({code}, {attr!r})"
+            elif token == ("op", "["):
+                self.pos += 1
+                key = self._parse_or()
+                self._expect("]")
+                code = f"_getitem({code}, {key})"
+            elif token == ("op", "("):
+                code = f"{code}({', '.join(self._parse_args())})"
+            else:
+                return code
+
+
+class _TemplateCompiler:
+    """Compiles template source into the Python source of a render function"""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.lines = [
+            "def _render(ctx):",
+            "    parts = []",
+            "    append = parts.append",
+            "    extend = parts.extend",
+        ]
+        self.indent = 1
+        self.scopes: List[Dict[str, str]] = [{}]
+        self.blocks: List[str] = []
+        self.loop_count = 0
+
+    def _tokens(self) -> List[List[str]]:
+        """Split source into text, expression and statement tokens"""
+        source = self.source
+        # Like Jinja2, drop a single trailing newline
+        if source.endswith('\n'):
+            source = source[:-1]
+
+        tokens: List[List[str]] = []
+        strip_next = False
+        for index, piece in enumerate(_TAG_RE.split(source)):
+            if index % 2 == 0:
+                if strip_next:
+                    piece = piece.lstrip()
+                    strip_next = False
+                tokens.append(["text", piece])
+                continue
+
+            kind = piece[:2]
+            inner = piece[2:-2]
+
+            # Whitespace control: {%- trims before the tag, -%} trims after
+            if inner.startswith('-'):
+                inner = inner[1:]
+                tokens[-1][1] = tokens[-1][1].rstrip()
+            if inner.endswith('-'):
+                inner = inner[:-1]
+                strip_next = True
+
+            if kind == "{#":
+                continue
+            tokens.append(["expr" if kind == "{{" else "stmt", inner.strip()])
+
+        return tokens
+
+    def _emit(self, line: str) -> None:
+        self.lines.append("    " * self.indent + line)
+
+    def _open(self, block: str, line: str) -> None:
+        self._emit(line)
+        self.blocks.append(block)
+        self.indent += 1
+        self._emit("pass")
+
+    def _close(self, block: str) -> None:
+        if not self.blocks or self.blocks[-1] != block:
+            raise ValueError(f"Unexpected '{{% end{block} %}}' in template")
+        self.blocks.pop()
+        self.indent -= 1
+
+    def _flush(self, chunks: List[str]) -> None:
+        if len(chunks) == 1:
+            self._emit(f"append({chunks[0]})")
+        elif chunks:
+            self._emit(f"extend(({', '.join(chunks)}))")
+        chunks.clear()
+
+    def _expression(self, expr: str) -> str:
+        return _ExpressionCompiler(expr, self.scopes[-1]).compile()
+
+    def _statement(self, stmt: str) -> None:
+        keyword = stmt.split(None, 1)[0] if stmt else ""
+
+        if keyword == "for":
+            match = _FOR_TAG_RE.match(stmt)
+            if not match:
+                raise ValueError(f"Invalid for loop in template: {stmt!r}")
+            iterable = self._expression(match.group(2))
+
+            # Loop variables become locals, named per loop so nesting can't clobber them
+            self.loop_count += 1
+            scope = dict(self.scopes[-1])
+            targets = []
+            for name in match.group(1).split(','):
+                name = name.strip()
+                scope[name] = f"l_{self.loop_count}_{name}"
+                targets.append(scope[name])
+
+            self._open("for", f"for {', '.join(targets)} in {iterable}:")
+            self.scopes.append(scope)
+        elif keyword == "endfor":
+            self._close("for")
+            self.scopes.pop()
+        elif keyword == "if":
+            self._open("if", f"if {self._expression(stmt[2:])}:")
+        elif keyword in ("elif", "else"):
+            if not self.blocks or self.blocks[-1] != "if":
+                raise ValueError(f"Unexpected '{{% {keyword} %}}' in template")
+            self.indent -= 1
+            if keyword == "elif":
+                self._emit(f"elif {self._expression(stmt[4:])}:")
+            else:
+                self._emit("else:")
+            self.indent += 1
+            self._emit("pass")
+        elif keyword == "endif":
+            self._close("if")
+        else:
+            raise ValueError(f"Unsupported template statement: {stmt!r}")
+
+    def compile(self) -> str:
+        """Return Python source defining `_render(ctx)`"""
+        # Consecutive text and expressions are buffered into one call
+        chunks: List[str] = []
+        text = ""
+        for kind, content in self._tokens():
+            if kind == "text":
+                # Adjacent literals (e.g. around a comment) become one string
+                text += content
+                continue
+            if text:
+                chunks.append(repr(text))
+                text = ""
+            if kind == "expr":
+                chunks.append(f"str({self._expression(content)})")
+            else:
+                self._flush(chunks)
+                self._statement(content)
+        if text:
+            chunks.append(repr(text))
+        self._flush(chunks)
 
-        result = re.sub(if_compare_pattern, replace_if_compare, result, flags=re.DOTALL)
+        if self.blocks:
+            raise ValueError(f"Unclosed '{{% {self.blocks[-1]} %}}' block in template")
 
-        # Handle conditionals with else: {% if condition %}...{% else %}...{% endif %}
-        if_else_pattern = r'{%\s*if\s+([\w.]+)\s*%}(.*?){%\s*else\s*%}(.*?){%\s*endif\s*%}'
+        self._emit("return ''.join(parts)")
+        return "\n".join(self.lines) + "\n"
 
-        def replace_if_else(match):
-            condition = match.group(1)
-            true_body = match.group(2)
-            false_body = match.group(3)
 
-            cond_val = self.resolve_value(condition, context)
+class SimpleTemplate:
+    """Minimal Jinja2-like template engine
 
-            if cond_val:
-                template = SimpleTemplate(true_body)
-                return template.render(context)
-            else:
-                template = SimpleTemplate(false_body)
-                return template.render(context)
+    The template is compiled once into a Python render function, so each
+    render is plain variable lookups and list appends joined at the end.
+    """
 
-        result = re.sub(if_else_pattern, replace_if_else, result, flags=re.DOTALL)
+    def __init__(self, template_str: str, name: str = "<template>"):
+        self.template = template_str
+        self.source = _TemplateCompiler(template_str).compile()
 
-        # Handle simple conditionals: {% if condition %}...{% endif %}
-        if_pattern = r'{%\s*if\s+([\w.]+)\s*%}(.*?){%\s*endif\s*%}'
+        namespace = dict(_RUNTIME)
+        exec(compile(self.source, name, "exec"), namespace)
+        self._render = namespace["_render"]
 
-        def replace_if(match):
-            condition = match.group(1)
-            body = match.group(2)
+    def render(self, context: Dict[str, Any]) -> str:
+        """Render template with context"""
+        return self._render(context)
 
-            cond_val = self.resolve_value(condition, context)
 
-            if cond_val:
-                template = SimpleTemplate(body)
-                return template.render(context)
-            return ""
+def _strip_prefix(value: str, prefix: str) -> str:
+    """Remove a leading prefix once (str.lstrip strips a character set instead)"""
+    return value[len(prefix):] if value.startswith(prefix) else value
 
-        result = re.sub(if_pattern, replace_if, result, flags=re.DOTALL)
 
-        # Replace variables with filters: {{ variable|filter }}
-        var_pattern = r'{{\s*([\w.|()\'",\s]+)\s*}}'
+# Component types whose frontmatter feeds all_agents/all_commands/all_skills
+COMPONENT_TYPES = ("agents", "commands", "skills")
 
-        def replace_var(match):
-            expr = match.group(1)
-            value = self.resolve_value(expr, context)
-            return str(value) if value is not None else ''
+# Component types each template lists individually
+TEMPLATE_COMPONENTS = {
+    "agents": ("agents",),
+    "agent-skills": ("skills",),
+    "plugins": (),
+    "usage": ("agents", "commands", "skills"),
+}
 
-        result = re.sub(var_pattern, replace_var, result)
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+# One "key: value" pair per line, split on the first colon, whitespace trimmed
+_FRONTMATTER_LINE_RE = re.compile(
+    r'^[^\S\n]*([^:\n]*?)[^\S\n]*:[^\S\n]*(.*?)[^\S\n]*$',
+    re.MULTILINE,
+)
 
-        # Clean up any remaining template syntax
-        result = re.sub(r'{%.*?%}', '', result)
-        result = re.sub(r'{{.*?}}', '', result)
 
-        return result
+@lru_cache(maxsize=None)
+def _read_frontmatter(path: str, mtime_ns: int) -> Dict[str, str]:
+    """Read and parse frontmatter, cached until the file's mtime changes"""
+    try:
+        with open(path, 'rb') as f:
+            # Without a leading '---' there is no frontmatter, so skip the full read
+            head = f.read(3)
+            if head != b'---':
+                return {}
+            content = (head + f.read()).decode('utf-8', errors='replace')
+    except FileNotFoundError:
+        # Removed after it was stat'ed
+        return {}
+    except OSError as e:
+        print(f"Warning: Could not parse frontmatter in {path}: {e}")
+        return {}
+
+    # Match frontmatter between --- delimiters
+    match = _FRONTMATTER_RE.match(content)
+    if not match:
+        return {}
+
+    # Simple YAML parsing (key: value)
+    return {
+        key: value.strip('"\'')
+        for key, value in _FRONTMATTER_LINE_RE.findall(match.group(1))
+    }
 
 
 class DocGenerator:
@@ -244,46 +539,43 @@ class DocGenerator:
         self.templates_dir = Path(templates_dir)
         self.output_dir = Path(output_dir)
         self.marketplace_data: Dict[str, Any] = {}
+        self._templates: Dict[str, SimpleTemplate] = {}
 
     def load_marketplace(self) -> None:
         """Load marketplace.json"""
         if not self.marketplace_path.exists():
             raise FileNotFoundError(f"Marketplace not found: {self.marketplace_path}")
 
-        with open(self.marketplace_path, 'r') as f:
-            self.marketplace_data = json.load(f)
+        content = self.marketplace_path.read_bytes()
+        if USE_ORJSON:
+            self.marketplace_data = orjson.loads(content)
+        else:
+            self.marketplace_data = json.loads(content)
 
     def extract_frontmatter(self, file_path: Path) -> Dict[str, str]:
         """Extract YAML frontmatter from a markdown file"""
-        if not file_path.exists():
-            return {}
-
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-
-            # Match frontmatter between --- delimiters
-            match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-            if not match:
-                return {}
+            mtime_ns = file_path.stat().st_mtime_ns
+        except OSError:
+            return {}
 
-            frontmatter_text = match.group(1)
-            frontmatter = {}
+        return dict(_read_frontmatter(str(file_path), mtime_ns))
 
-            # Simple YAML parsing (key: value)
-            for line in frontmatter_text.split('\n'):
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    frontmatter[key.strip()] = value.strip().strip('"\'')
+    def extract_all_frontmatter(self, file_paths: List[Path]) -> List[Dict[str, str]]:
+        """Extract frontmatter from many files, reading them concurrently"""
+        if not file_paths:
+            return []
 
-            return frontmatter
+        # File reads release the GIL; cap workers to avoid exhausting file descriptors
+        with ThreadPoolExecutor(max_workers=min(32, len(file_paths))) as executor:
+            return list(executor.map(self.extract_frontmatter, file_paths))
 
-        except Exception as e:
-            print(f"Warning: Could not parse frontmatter in {file_path}: {e}")
-            return {}
+    def build_context(self, include: Collection[str] = COMPONENT_TYPES) -> Dict[str, Any]:
+        """Build template context from marketplace data
 
-    def build_context(self) -> Dict[str, Any]:
-        """Build template context from marketplace data"""
+        Only the component types in `include` have their frontmatter read into
+        all_agents/all_commands/all_skills; stats always count every type.
+        """
         context = {
             "marketplace": self.marketplace_data,
             "now": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -305,64 +597,70 @@ class DocGenerator:
         plugins = self.marketplace_data["plugins"]
         context["stats"]["total_plugins"] = len(plugins)
 
-        # Organize plugins by category
+        # Organize plugins by category and collect component files to read
+        components: List[Tuple[str, str, str, Path]] = []
         for plugin in plugins:
             category = plugin.get("category", "general")
-            if category not in context["plugins_by_category"]:
-                context["plugins_by_category"][category] = []
-            context["plugins_by_category"][category].append(plugin)
+            context["plugins_by_category"].setdefault(category, []).append(plugin)
 
             plugin_name = plugin.get("name", "")
             plugin_dir = Path(f"plugins/{plugin_name}")
 
-            # Extract agent information
-            if "agents" in plugin:
+            if "agents" in plugin and "agents" in include:
                 for agent_path in plugin["agents"]:
-                    agent_file = agent_path.replace("./agents/", "")
-                    full_path = plugin_dir / agent_path.lstrip('./')
-                    frontmatter = self.extract_frontmatter(full_path)
-
-                    context["all_agents"].append({
-                        "plugin": plugin_name,
-                        "name": frontmatter.get("name", agent_file.replace(".md", "")),
-                        "file": agent_file,
-                        "description": frontmatter.get("description", ""),
-                        "model": frontmatter.get("model", ""),
-                    })
+                    rel_path = _strip_prefix(agent_path, "./")
+                    agent_file = _strip_prefix(rel_path, "agents/")
+                    full_path = plugin_dir / rel_path
+                    components.append(("agent", plugin_name, agent_file, full_path))
 
-                context["stats"]["total_agents"] += len(plugin["agents"])
-
-            # Extract command information
-            if "commands" in plugin:
+            if "commands" in plugin and "commands" in include:
                 for cmd_path in plugin["commands"]:
-                    cmd_file = cmd_path.replace("./commands/", "")
-                    full_path = plugin_dir / cmd_path.lstrip('./')
-                    frontmatter = self.extract_frontmatter(full_path)
+                    rel_path = _strip_prefix(cmd_path, "./")
+                    cmd_file = _strip_prefix(rel_path, "commands/")
+                    full_path = plugin_dir / rel_path
+                    components.append(("command", plugin_name, cmd_file, full_path))
 
-                    context["all_commands"].append({
-                        "plugin": plugin_name,
-                        "name": frontmatter.get("name", cmd_file.replace(".md", "")),
-                        "file": cmd_file,
-                        "description": frontmatter.get("description", ""),
-                    })
+            if "skills" in plugin and "skills" in include:
+                for skill_path in plugin["skills"]:
+                    rel_path = _strip_prefix(skill_path, "./")
+                    skill_name = _strip_prefix(rel_path, "skills/")
+                    full_path = plugin_dir / rel_path / "SKILL.md"
+                    components.append(("skill", plugin_name, skill_name, full_path))
 
-                context["stats"]["total_commands"] += len(plugin["commands"])
+            context["stats"]["total_agents"] += len(plugin.get("agents", []))
+            context["stats"]["total_commands"] += len(plugin.get("commands", []))
+            context["stats"]["total_skills"] += len(plugin.get("skills", []))
 
-            # Extract skill information
-            if "skills" in plugin:
-                for skill_path in plugin["skills"]:
-                    skill_name = skill_path.replace("./skills/", "")
-                    full_path = plugin_dir / skill_path.lstrip('./') / "SKILL.md"
-                    frontmatter = self.extract_frontmatter(full_path)
+        frontmatters = self.extract_all_frontmatter([c[3] for c in components])
+
+        for (kind, plugin_name, file_name, _), frontmatter in zip(components, frontmatters):
+            # Extract agent information
+            if kind == "agent":
+                context["all_agents"].append({
+                    "plugin": plugin_name,
+                    "name": frontmatter.get("name", file_name.replace(".md", "")),
+                    "file": file_name,
+                    "description": frontmatter.get("description", ""),
+                    "model": frontmatter.get("model", ""),
+                })
 
-                    context["all_skills"].append({
-                        "plugin": plugin_name,
-                        "name": frontmatter.get("name", skill_name),
-                        "path": skill_name,
-                        "description": frontmatter.get("description", ""),
-                    })
+            # Extract command information
+            elif kind == "command":
+                context["all_commands"].append({
+                    "plugin": plugin_name,
+                    "name": frontmatter.get("name", file_name.replace(".md", "")),
+                    "file": file_name,
+                    "description": frontmatter.get("description", ""),
+                })
 
-                context["stats"]["total_skills"] += len(plugin["skills"])
+            # Extract skill information
+            else:
+                context["all_skills"].append({
+                    "plugin": plugin_name,
+                    "name": frontmatter.get("name", file_name),
+                    "path": file_name,
+                    "description": frontmatter.get("description", ""),
+                })
 
         return context
 
@@ -373,23 +671,28 @@ class DocGenerator:
         if not template_path.exists():
             raise FileNotFoundError(f"Template not found: {template_path}")
 
-        with open(template_path, 'r') as f:
-            template_content = f.read()
-
         if USE_JINJA2:
-            # Use real Jinja2 for full compatibility
-            template = Jinja2Template(template_content)
+            # Use real Jinja2 for full compatibility, compiled once per template
+            env = get_jinja2_environment(self.templates_dir)
+            template = env.get_template(template_path.name)
             return template.render(**context)
-        else:
-            # Fallback to SimpleTemplate
-            template = SimpleTemplate(template_content)
-            return template.render(context)
 
-    def generate_all(self, dry_run: bool = False, specific_file: Optional[str] = None) -> None:
-        """Generate all documentation files"""
-        self.load_marketplace()
-        context = self.build_context()
+        # Fallback to SimpleTemplate, compiled once per template
+        compiled = self._templates.get(template_name)
+        if compiled is None:
+            with open(template_path, 'r') as f:
+                compiled = SimpleTemplate(f.read(), name=str(template_path))
+            self._templates[template_name] = compiled
+
+        return compiled.render(context)
 
+    def generate_all(
+        self,
+        dry_run: bool = False,
+        specific_file: Optional[str] = None,
+        parallel: bool = False,
+    ) -> None:
+        """Generate all documentation files"""
         docs_to_generate = {
             "agents": "agents.md",
             "agent-skills": "agent-skills.md",
@@ -402,10 +705,49 @@ class DocGenerator:
                 raise ValueError(f"Unknown documentation file: {specific_file}")
             docs_to_generate = {specific_file: docs_to_generate[specific_file]}
 
+        # Only read frontmatter for the component types the chosen docs list
+        include = {
+            component_type
+            for name in docs_to_generate
+            for component_type in TEMPLATE_COMPONENTS[name]
+        }
+
+        self.load_marketplace()
+        context = self.build_context(include)
+
+        # Render each template in its own process; results are still written in order
+        executor = None
+        futures = {}
+        if parallel and len(docs_to_generate) > 1:
+            executor = ProcessPoolExecutor(max_workers=len(docs_to_generate))
+            futures = {
+                template_name: executor.submit(
+                    _render_one, str(self.templates_dir), template_name, context
+                )
+                for template_name in docs_to_generate
+            }
+
+        try:
+            self._write_docs(docs_to_generate, context, futures, dry_run)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def _write_docs(
+        self,
+        docs_to_generate: Dict[str, str],
+        context: Dict[str, Any],
+        futures: Dict[str, "Future[str]"],
+        dry_run: bool,
+    ) -> None:
+        """Render (or collect) each document and write or preview it"""
         for template_name, output_file in docs_to_generate.items():
             try:
                 print(f"Generating {output_file}...")
-                content = self.render_template(template_name, context)
+                if template_name in futures:
+                    content = futures[template_name].result()
+                else:
+                    content = self.render_template(template_name, context)
 
                 if dry_run:
                     print(f"\n--- {output_file} ---")
@@ -415,8 +757,7 @@ class DocGenerator:
                     output_path = self.output_dir / output_file
                     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-                    with open(output_path, 'w') as f:
-                        f.write(content)
+                    output_path.write_bytes(content.encode('utf-8'))
 
                     print(f"✓ Generated {output_path}")
 
@@ -424,6 +765,11 @@ class DocGenerator:
                 print(f"❌ Error generating {output_file}: {e}")
 
 
+def _render_one(templates_dir: str, template_name: str, context: Dict[str, Any]) -> str:
+    """Render a single template in a worker process"""
+    return DocGenerator(templates_dir=templates_dir).render_template(template_name, context)
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description="Generate documentation from marketplace")
@@ -452,6 +798,11 @@ def main():
         action="store_true",
         help="Show output without writing files",
     )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Render templates concurrently in separate processes",
+    )
 
     args = parser.parse_args()
 
@@ -462,7 +813,11 @@ def main():
             output_dir=args.output,
         )
 
-        generator.generate_all(dry_run=args.dry_run, specific_file=args.file)
+        generator.generate_all(
+            dry_run=args.dry_run,
+            specific_file=args.file,
+            parallel=args.parallel,
+        )
 
         if not args.dry_run:
             print("\n✓ Documentation generation complete")
@@ -6,13 +6,25 @@ Updates the .claude-plugin/marketplace.json file when plugins are added,
 modified, or removed.
 """
 
+import inspect
 import json
 import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Set, Tuple
 import argparse
 
+# Use orjson for faster parsing and serialization if available
+try:
+    import orjson
+    USE_ORJSON = True
+except ImportError:
+    USE_ORJSON = False
+
+# Batch operation fields that aren't plain strings
+BATCH_LIST_FIELDS = {"agents", "commands", "skills", "keywords"}
+BATCH_BOOL_FIELDS = {"strict"}
+
 
 class MarketplaceUpdater:
     """Handles marketplace.json updates"""
@@ -20,6 +32,8 @@ class MarketplaceUpdater:
     def __init__(self, marketplace_path: str = ".claude-plugin/marketplace.json"):
         self.marketplace_path = Path(marketplace_path)
         self.marketplace_data: Dict[str, Any] = {}
+        self._by_name: Dict[str, Dict[str, Any]] = {}
+        self._component_sets: Dict[Tuple[str, str], Set[str]] = {}
 
     def load(self) -> None:
         """Load marketplace.json file"""
@@ -27,16 +41,37 @@ class MarketplaceUpdater:
             raise FileNotFoundError(f"Marketplace file not found: {self.marketplace_path}")
 
         try:
-            with open(self.marketplace_path, 'r') as f:
-                self.marketplace_data = json.load(f)
+            content = self.marketplace_path.read_bytes()
+            if USE_ORJSON:
+                self.marketplace_data = orjson.loads(content)
+            else:
+                self.marketplace_data = json.loads(content)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in marketplace file: {e}")
 
+        self._index_plugins()
+
+    def _index_plugins(self) -> None:
+        """Index plugins by name for constant-time lookup"""
+        self._by_name = {}
+        self._component_sets = {}
+        for plugin in self.marketplace_data.get("plugins", []):
+            # Keep the first entry for duplicated names, as a linear scan would
+            if "name" in plugin:
+                self._by_name.setdefault(plugin["name"], plugin)
+
     def save(self) -> None:
         """Save marketplace.json file"""
-        with open(self.marketplace_path, 'w') as f:
-            json.dump(self.marketplace_data, f, indent=2)
-            f.write('\n')  # Add trailing newline
+        if USE_ORJSON:
+            content = orjson.dumps(
+                self.marketplace_data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
+            )
+        else:
+            # Match orjson's output: UTF-8 rather than \u escapes, trailing newline
+            content = (json.dumps(self.marketplace_data, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+
+        self.marketplace_path.write_bytes(content)
 
     def add_plugin(
         self,
@@ -55,7 +90,40 @@ class MarketplaceUpdater:
     ) -> None:
         """Add a new plugin to the marketplace"""
         self.load()
+        message = self._add_plugin(
+            name=name,
+            description=description,
+            version=version,
+            category=category,
+            agents=agents,
+            commands=commands,
+            skills=skills,
+            keywords=keywords,
+            license=license,
+            strict=strict,
+            author_name=author_name,
+            author_url=author_url,
+        )
+        self.save()
+
+        print(message)
 
+    def _add_plugin(
+        self,
+        name: str,
+        description: str,
+        version: str,
+        category: str = "general",
+        agents: Optional[List[str]] = None,
+        commands: Optional[List[str]] = None,
+        skills: Optional[List[str]] = None,
+        keywords: Optional[List[str]] = None,
+        license: str = "MIT",
+        strict: bool = False,
+        author_name: Optional[str] = None,
+        author_url: Optional[str] = None,
+    ) -> str:
+        """Add a plugin entry to the loaded marketplace data"""
         # Check if plugin already exists
         if "plugins" not in self.marketplace_data:
             self.marketplace_data["plugins"] = []
@@ -111,9 +179,9 @@ class MarketplaceUpdater:
 
         # Add plugin to marketplace
         self.marketplace_data["plugins"].append(plugin_entry)
-        self.save()
+        self._by_name[name] = plugin_entry
 
-        print(f"✓ Added plugin '{name}' to marketplace")
+        return f"✓ Added plugin '{name}' to marketplace"
 
     def update_plugin(
         self,
@@ -131,7 +199,38 @@ class MarketplaceUpdater:
     ) -> None:
         """Update an existing plugin"""
         self.load()
+        message = self._update_plugin(
+            name=name,
+            description=description,
+            version=version,
+            category=category,
+            keywords=keywords,
+            add_agent=add_agent,
+            remove_agent=remove_agent,
+            add_command=add_command,
+            remove_command=remove_command,
+            add_skill=add_skill,
+            remove_skill=remove_skill,
+        )
+        self.save()
+
+        print(message)
 
+    def _update_plugin(
+        self,
+        name: str,
+        description: Optional[str] = None,
+        version: Optional[str] = None,
+        category: Optional[str] = None,
+        keywords: Optional[List[str]] = None,
+        add_agent: Optional[str] = None,
+        remove_agent: Optional[str] = None,
+        add_command: Optional[str] = None,
+        remove_command: Optional[str] = None,
+        add_skill: Optional[str] = None,
+        remove_skill: Optional[str] = None,
+    ) -> str:
+        """Update a plugin entry in the loaded marketplace data"""
         plugin = self._find_plugin(name)
         if not plugin:
             raise ValueError(f"Plugin '{name}' not found in marketplace")
@@ -148,61 +247,131 @@ class MarketplaceUpdater:
 
         # Update agents
         if add_agent:
-            if "agents" not in plugin:
-                plugin["agents"] = []
-            agent_path = f"./agents/{add_agent}"
-            if agent_path not in plugin["agents"]:
-                plugin["agents"].append(agent_path)
+            self._add_component(plugin, "agents", f"./agents/{add_agent}")
 
         if remove_agent:
-            if "agents" in plugin:
-                agent_path = f"./agents/{remove_agent}"
-                if agent_path in plugin["agents"]:
-                    plugin["agents"].remove(agent_path)
+            self._remove_component(plugin, "agents", f"./agents/{remove_agent}")
 
         # Update commands
         if add_command:
-            if "commands" not in plugin:
-                plugin["commands"] = []
-            cmd_path = f"./commands/{add_command}"
-            if cmd_path not in plugin["commands"]:
-                plugin["commands"].append(cmd_path)
+            self._add_component(plugin, "commands", f"./commands/{add_command}")
 
         if remove_command:
-            if "commands" in plugin:
-                cmd_path = f"./commands/{remove_command}"
-                if cmd_path in plugin["commands"]:
-                    plugin["commands"].remove(cmd_path)
+            self._remove_component(plugin, "commands", f"./commands/{remove_command}")
 
         # Update skills
         if add_skill:
-            if "skills" not in plugin:
-                plugin["skills"] = []
-            skill_path = f"./skills/{add_skill}"
-            if skill_path not in plugin["skills"]:
-                plugin["skills"].append(skill_path)
+            self._add_component(plugin, "skills", f"./skills/{add_skill}")
 
         if remove_skill:
-            if "skills" in plugin:
-                skill_path = f"./skills/{remove_skill}"
-                if skill_path in plugin["skills"]:
-                    plugin["skills"].remove(skill_path)
+            self._remove_component(plugin, "skills", f"./skills/{remove_skill}")
 
-        self.save()
-        print(f"✓ Updated plugin '{name}' in marketplace")
+        return f"✓ Updated plugin '{name}' in marketplace"
 
     def remove_plugin(self, name: str) -> None:
         """Remove a plugin from the marketplace"""
         self.load()
+        message = self._remove_plugin(name)
+        self.save()
+
+        print(message)
 
+    def _remove_plugin(self, name: str) -> str:
+        """Remove a plugin entry from the loaded marketplace data"""
         plugin = self._find_plugin(name)
         if not plugin:
             raise ValueError(f"Plugin '{name}' not found in marketplace")
 
         self.marketplace_data["plugins"].remove(plugin)
+        self._index_plugins()
+
+        return f"✓ Removed plugin '{name}' from marketplace"
+
+    def _component_index(self, plugin: Dict[str, Any], kind: str) -> Set[str]:
+        """Get the membership set shadowing a plugin's component list"""
+        key = (plugin["name"], kind)
+        index = self._component_sets.get(key)
+        if index is None:
+            # Built on first use, so one-off updates don't index every plugin
+            index = set(plugin.get(kind, []))
+            self._component_sets[key] = index
+        return index
+
+    def _add_component(self, plugin: Dict[str, Any], kind: str, path: str) -> None:
+        """Append a component path unless the plugin already lists it"""
+        components = plugin.setdefault(kind, [])
+        index = self._component_index(plugin, kind)
+        if path not in index:
+            components.append(path)
+            index.add(path)
+
+    def _remove_component(self, plugin: Dict[str, Any], kind: str, path: str) -> None:
+        """Remove a component path if the plugin lists it"""
+        if kind not in plugin:
+            return
+
+        index = self._component_index(plugin, kind)
+        if path in index:
+            plugin[kind].remove(path)
+            # Only drop it from the set once no duplicate entry remains
+            if path not in plugin[kind]:
+                index.discard(path)
+
+    def batch(self, operations: List[Dict[str, Any]]) -> None:
+        """Apply several add/update/remove operations with a single load and save
+
+        Each operation is a dict with an "op" key ("add", "update" or
+        "remove") and the keyword arguments of the matching method. Nothing
+        is written unless every operation succeeds.
+        """
+        self.load()
+
+        handlers: Dict[str, Callable[..., str]] = {
+            "add": self._add_plugin,
+            "update": self._update_plugin,
+            "remove": self._remove_plugin,
+        }
+
+        messages = []
+        for i, operation in enumerate(operations):
+            if not isinstance(operation, dict):
+                raise ValueError(f"Operation {i}: Expected an object")
+
+            params = dict(operation)
+            op = params.pop("op", None)
+            if op not in handlers:
+                raise ValueError(f"Operation {i}: Unknown op '{op}'")
+
+            handler = handlers[op]
+            signature = inspect.signature(handler)
+            try:
+                signature.bind(**params)
+            except TypeError as e:
+                raise ValueError(f"Operation {i}: Invalid arguments for '{op}': {e}")
+
+            for field, value in params.items():
+                # Optional fields may be given as null
+                if value is None and signature.parameters[field].default is None:
+                    continue
+
+                if field in BATCH_LIST_FIELDS:
+                    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+                        raise ValueError(f"Operation {i}: Field '{field}' must be a list of strings")
+                elif field in BATCH_BOOL_FIELDS:
+                    if not isinstance(value, bool):
+                        raise ValueError(f"Operation {i}: Field '{field}' must be a boolean")
+                elif not isinstance(value, str):
+                    raise ValueError(f"Operation {i}: Field '{field}' must be a string")
+
+            try:
+                messages.append(handler(**params))
+            except ValueError as e:
+                raise ValueError(f"Operation {i}: {e}")
+
         self.save()
 
-        print(f"✓ Removed plugin '{name}' from marketplace")
+        for message in messages:
+            print(message)
 
     def validate(self) -> bool:
         """Validate marketplace structure"""
@@ -220,6 +389,8 @@ class MarketplaceUpdater:
         # Validate plugins
         if "plugins" in self.marketplace_data:
             plugin_names = set()
+            # Directory listings shared by component checks, one scandir per directory
+            listings: Dict[Path, Set[str]] = {}
             for i, plugin in enumerate(self.marketplace_data["plugins"]):
                 # Check required plugin fields
                 plugin_required = ["name", "source", "description", "version"]
@@ -239,7 +410,7 @@ class MarketplaceUpdater:
                     if "agents" in plugin:
                         for agent in plugin["agents"]:
                             agent_path = plugin_dir / agent
-                            if not agent_path.exists():
+                            if not self._component_exists(listings, plugin_dir, agent):
                                 warnings.append(
                                     f"Plugin '{plugin['name']}': Agent file not found: {agent_path}"
                                 )
@@ -247,7 +418,7 @@ class MarketplaceUpdater:
                     if "commands" in plugin:
                         for command in plugin["commands"]:
                             cmd_path = plugin_dir / command
-                            if not cmd_path.exists():
+                            if not self._component_exists(listings, plugin_dir, command):
                                 warnings.append(
                                     f"Plugin '{plugin['name']}': Command file not found: {cmd_path}"
                                 )
@@ -255,7 +426,7 @@ class MarketplaceUpdater:
                     if "skills" in plugin:
                         for skill in plugin["skills"]:
                             skill_path = plugin_dir / skill / "SKILL.md"
-                            if not skill_path.exists():
+                            if not self._component_exists(listings, plugin_dir, f"{skill}/SKILL.md"):
                                 warnings.append(
                                     f"Plugin '{plugin['name']}': Skill file not found: {skill_path}"
                                 )
@@ -275,16 +446,43 @@ class MarketplaceUpdater:
 
         return len(errors) == 0
 
+    def _list_dir(self, directory: Path) -> Set[str]:
+        """List the names of existing files and directories in one directory"""
+        names: Set[str] = set()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # Follows symlinks like Path.exists(), so broken links are left out
+                    if entry.is_file() or entry.is_dir():
+                        names.add(entry.name)
+        except OSError:
+            pass
+        return names
+
+    def _component_exists(
+        self, listings: Dict[Path, Set[str]], plugin_dir: Path, component: str
+    ) -> bool:
+        """Check whether a component path relative to its plugin exists"""
+        path = plugin_dir / component
+        rel_path = component[2:] if component.startswith("./") else component
+        parts = rel_path.split("/")
+
+        # Only plain "<dir>/<name>" paths use the directory listing
+        if "\\" in rel_path or any(part in ("", ".", "..") for part in parts):
+            return path.exists()
+
+        directory = plugin_dir.joinpath(*parts[:-1])
+        listing = listings.get(directory)
+        if listing is None:
+            listing = self._list_dir(directory)
+            listings[directory] = listing
+
+        # A miss may still exist under another spelling on case-insensitive filesystems
+        return parts[-1] in listing or path.exists()
+
     def _find_plugin(self, name: str) -> Optional[Dict[str, Any]]:
         """Find a plugin by name"""
-        if "plugins" not in self.marketplace_data:
-            return None
-
-        for plugin in self.marketplace_data["plugins"]:
-            if plugin.get("name") == name:
-                return plugin
-
-        return None
+        return self._by_name.get(name)
 
 
 def main():
@@ -340,6 +538,21 @@ def main():
         help="Path to marketplace.json",
     )
 
+    # Batch command
+    batch_parser = subparsers.add_parser(
+        "batch", help="Apply several operations with a single load and save"
+    )
+    batch_parser.add_argument(
+        "--ops-file",
+        required=True,
+        help="JSON file with a list of operations, e.g. [{\"op\": \"remove\", \"name\": \"x\"}]",
+    )
+    batch_parser.add_argument(
+        "--marketplace",
+        default=".claude-plugin/marketplace.json",
+        help="Path to marketplace.json",
+    )
+
     # Validate command
     validate_parser = subparsers.add_parser("validate", help="Validate marketplace.json")
     validate_parser.add_argument(
@@ -393,6 +606,16 @@ def main():
         elif args.command == "remove":
             updater.remove_plugin(name=args.name)
 
+        elif args.command == "batch":
+            try:
+                with open(args.ops_file, 'r') as f:
+                    operations = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON in operations file {args.ops_file}: {e}")
+            if not isinstance(operations, list):
+                raise ValueError(f"Operations file must contain a JSON list: {args.ops_file}")
+            updater.batch(operations)
+
         elif args.command == "validate":
             if not updater.validate():
                 sys.exit(1)